@@ -0,0 +1,147 @@
+#!/usr/bin/env python3
+"""
+Benchmark and check chunked encoding against a single ffmpeg process.
+
+Generates a synthetic image sequence, encodes it with an intra-only codec once in a single ffmpeg process and once in
+chunks encoded by local processes standing in for farm workers and joined with the concat demuxer, and prints the time
+of each. The joined movie is checked with ffprobe and ffmpeg: it must have every frame, the same start timecode as the
+single movie, and decode without errors. The PSNR between the two movies is printed for reference, since encoders
+with rate control across frames can encode the frames next to chunk boundaries differently.
+
+    python3 benchmarks/bench_chunks.py --codec avchq --frames 96 --chunk-frames 24
+    python3 benchmarks/bench_chunks.py --codec prores_hq --chunk-frames 12 --chunk-jobs 4 --output results.json
+"""
+import os, sys
+import copy
+import json
+import re
+import argparse
+import tempfile
+import shutil
+import subprocess
+
+import yaml
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+from bench_daily import generate_sequence, run_daily, repo_path
+
+
+def probe_frames(movie):
+    """
+    Returns:
+        The number of frames ffprobe decodes from the movie.
+    """
+    output = subprocess.check_output(["ffprobe", "-v", "error", "-count_frames", "-select_streams", "v:0",
+        "-show_entries", "stream=nb_read_frames", "-of", "csv=p=0", movie])
+    return int(output.decode().strip().split(",")[0])
+
+
+def probe_timecode(movie):
+    """
+    Returns:
+        The start timecode of the movie, or None if it has none.
+    """
+    output = subprocess.check_output(["ffprobe", "-v", "error", "-show_entries", "format_tags=timecode:stream_tags=timecode",
+        "-of", "json", movie])
+    probe = json.loads(output.decode())
+    for section in [probe.get("format", {})] + probe.get("streams", []):
+        timecode = section.get("tags", {}).get("timecode")
+        if timecode:
+            return timecode
+    return None
+
+
+def decode_errors(movie):
+    """
+    Returns:
+        The errors ffmpeg logs while decoding the movie, empty if there are none.
+    """
+    result = subprocess.run(["ffmpeg", "-v", "error", "-i", movie, "-f", "null", "-"], stdout=subprocess.PIPE, stderr=subprocess.PIPE)
+    return result.stderr.decode(errors="replace").strip()
+
+
+def psnr(movie, reference):
+    """
+    Returns:
+        The average PSNR of the movie against the reference movie in dB, or None if ffmpeg did not report it.
+    """
+    result = subprocess.run(["ffmpeg", "-i", movie, "-i", reference, "-lavfi", "psnr", "-f", "null", "-"],
+        stdout=subprocess.PIPE, stderr=subprocess.PIPE)
+    match = re.search(r"average:(\S+)", result.stderr.decode(errors="replace"))
+    if not match:
+        return None
+    return float("inf") if match.group(1) == "inf" else float(match.group(1))
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark and check chunked encoding of an intra-only codec.")
+    parser.add_argument("--config", default=os.getenv("DAILIES_CONFIG") or os.path.join(repo_path, "dailies-config.yaml"),
+        help="Dailies config to use. Defaults to $DAILIES_CONFIG or the config next to daily.")
+    parser.add_argument("--codec", default="avchq", help="Intra-only output codec to encode with.")
+    parser.add_argument("--profile", default="internal", help="Dailies profile to encode with.")
+    parser.add_argument("--width", type=int, default=2048)
+    parser.add_argument("--height", type=int, default=1152)
+    parser.add_argument("--frames", type=int, default=96)
+    parser.add_argument("--chunk-frames", type=int, default=24, help="Number of frames in each chunk.")
+    parser.add_argument("--chunk-jobs", type=int, help="Number of chunks to encode at the same time. Defaults to chunk_jobs in the config.")
+    parser.add_argument("--workdir", help="Directory for the images and movies. Defaults to a temporary directory that is removed afterwards.")
+    parser.add_argument("--output", help="Write the results as json to this file.")
+    args = parser.parse_args()
+
+    with open(args.config) as config_file:
+        config = yaml.safe_load(config_file)
+
+    workdir = args.workdir or tempfile.mkdtemp(prefix="bench_chunks_")
+    results = {}
+    errors = []
+    try:
+        input_path = generate_sequence(os.path.join(workdir, "images"), "exr", args.width, args.height, 4, None, args.frames)
+        for mode in ("single", "chunked"):
+            mode_config = copy.deepcopy(config)
+            if mode == "chunked":
+                mode_config["globals"]["chunk_frames"] = args.chunk_frames
+                if args.chunk_jobs:
+                    mode_config["globals"]["chunk_jobs"] = args.chunk_jobs
+            else:
+                mode_config["globals"]["chunk_frames"] = None
+            stats = run_daily(mode_config, input_path, args.codec, args.profile, os.path.join(workdir, "movies", mode))
+            if not stats:
+                errors.append("{0}: daily failed".format(mode))
+                continue
+            results[mode] = {"wall_time": stats["wall_time"], "fps": stats["fps"], "frames": stats["frames"], "movie": stats["movie"]}
+
+        if "single" in results and "chunked" in results:
+            single, chunked = results["single"]["movie"], results["chunked"]["movie"]
+            frames = probe_frames(chunked)
+            if frames != args.frames:
+                errors.append("chunked movie has {0} frames, expected {1}".format(frames, args.frames))
+            if results["chunked"]["frames"] != args.frames:
+                errors.append("chunked stats count {0} frames, expected {1}".format(results["chunked"]["frames"], args.frames))
+            timecodes = probe_timecode(single), probe_timecode(chunked)
+            if timecodes[0] != timecodes[1]:
+                errors.append("chunked movie starts at timecode {1}, single movie at {0}".format(*timecodes))
+            decode_error = decode_errors(chunked)
+            if decode_error:
+                errors.append("chunked movie does not decode cleanly:\n{0}".format(decode_error))
+            results["timecode"] = timecodes[1]
+            results["psnr"] = psnr(chunked, single)
+    finally:
+        if not args.workdir:
+            shutil.rmtree(workdir, ignore_errors=True)
+
+    for mode in ("single", "chunked"):
+        if mode in results:
+            print("{0:<8} {1:8.2f} s {2:8.2f} fps".format(mode, results[mode]["wall_time"], results[mode]["fps"]))
+    if "single" in results and "chunked" in results:
+        print("Speedup: {0:.2f}x. Start timecode {1}. PSNR of the chunked movie against the single movie: {2} dB".format(
+            results["single"]["wall_time"] / max(results["chunked"]["wall_time"], 1e-9), results.get("timecode"), results.get("psnr")))
+    for error in errors:
+        print("Error: {0}".format(error))
+    if args.output:
+        with open(args.output, "w") as output_file:
+            json.dump(dict(results, errors=errors, frames=args.frames, chunk_frames=args.chunk_frames), output_file, indent=2, sort_keys=True)
+    return 1 if errors else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,175 @@
+#!/usr/bin/env python3
+"""
+Benchmark the daily pipeline stage by stage.
+
+Generates synthetic image sequences, then runs daily on each of them for every output codec and dailies profile
+in the config. Collects the seconds spent in each stage (read, channels, ocio, reformat, composite, framecounter,
+get_pixels, yuv_convert, pipe_write, encoder) and the page faults from the .stats.json file that daily writes next to each movie when write_stats is enabled.
+
+    python3 benchmarks/bench_daily.py --formats exr tif jpg --width 2048 --height 1152 --frames 24 --output results.json
+    python3 benchmarks/bench_daily.py --codecs h264_hq --profiles internal --channels 7 --compression piz
+"""
+import os, sys
+import copy
+import json
+import time
+import argparse
+import tempfile
+import shutil
+import subprocess
+
+import OpenImageIO as oiio
+import yaml
+
+repo_path = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+daily_path = os.path.join(repo_path, "daily")
+
+# Pixel format and default compression for each image format
+IMAGE_FORMATS = {
+    "exr": (oiio.HALF, "zip"),
+    "tif": (oiio.UINT16, "zip"),
+    "jpg": (oiio.UINT8, "jpeg:90"),
+}
+
+
+def generate_sequence(directory, image_format, width, height, channels, compression, frames):
+    """
+    Write a synthetic image sequence: a noise image with a gradient, and a patch that changes every frame.
+
+    Args:
+        directory: Directory to write the images into.
+        image_format: exr, tif or jpg.
+        width, height: Resolution of the images.
+        channels: Number of channels. Channels after RGBA are named extra1, extra2...
+        compression: Compression to write the images with. If None, the default for the format is used.
+        frames: Number of frames.
+
+    Returns:
+        The path of the directory containing the sequence.
+    """
+    pixel_type, default_compression = IMAGE_FORMATS[image_format]
+    if image_format == "jpg":
+        channels = 3
+    spec = oiio.ImageSpec(width, height, channels, pixel_type)
+    names = ["R", "G", "B", "A"][:channels] + ["extra{0}".format(i) for i in range(1, channels - 3)]
+    spec.channelnames = tuple(names)
+    spec.attribute("compression", compression or default_compression)
+
+    buf = oiio.ImageBuf(spec)
+    oiio.ImageBufAlgo.fill(buf, (0.0,) * channels, (1.0,) * channels, (0.0,) * channels, (1.0,) * channels)
+    oiio.ImageBufAlgo.noise(buf, "gaussian", 0.0, 0.1)
+
+    if not os.path.isdir(directory):
+        os.makedirs(directory)
+    patch = oiio.ROI(0, max(1, width // 16), 0, max(1, height // 16))
+    for frame in range(1001, 1001 + frames):
+        value = (frame % 100) / 100.0
+        oiio.ImageBufAlgo.fill(buf, (value,) * channels, roi=patch)
+        buf.write(os.path.join(directory, "bench_{0}.{1:04d}.{0}".format(image_format, frame)))
+    return directory
+
+
+def run_daily(config, input_path, codec, profile, output_path):
+    """
+    Run daily on an image sequence with a copy of config that writes stage timings.
+
+    Returns:
+        The stats dict that daily wrote, or None if it failed.
+    """
+    config = copy.deepcopy(config)
+    config["globals"].update({
+        "movie_location": output_path,
+        "write_stats": True,
+        "sequence_index": None,
+        "debug": False,
+        "batch_jobs": None,
+        })
+    if not os.path.isdir(output_path):
+        os.makedirs(output_path)
+    config_path = os.path.join(output_path, "dailies-config.yaml")
+    with open(config_path, "w") as config_file:
+        yaml.safe_dump(config, config_file)
+
+    env = dict(os.environ, DAILIES_CONFIG=config_path, DAILIES_CONFIG_CACHE="")
+    command = [sys.executable, daily_path, input_path, "-c", codec, "-p", profile,
+        "-t", "artist: Benchmark | comment: Synthetic benchmark sequence | discipline: comp"]
+    start = time.time()
+    result = subprocess.run(command, cwd=repo_path, env=env, stdout=subprocess.PIPE, stderr=subprocess.STDOUT)
+    elapsed = time.time() - start
+    stats_files = [f for f in os.listdir(output_path) if f.endswith(".stats.json")]
+    if result.returncode != 0 or not stats_files:
+        print("daily failed for codec {0} profile {1}:\n{2}".format(codec, profile, result.stdout.decode(errors="replace")[-2000:]))
+        return None
+    with open(os.path.join(output_path, stats_files[0])) as stats_file:
+        stats = json.load(stats_file)
+    stats["wall_time"] = elapsed
+    return stats
+
+
+def print_results(results):
+    columns = ["read", "channels", "ocio", "reformat", "composite", "framecounter", "get_pixels", "yuv_convert", "jpeg_encode", "pipe_write", "encoder_cpu"]
+    print("{0:<6} {1:<12} {2:<10} {3:>7} ".format("format", "codec", "profile", "fps") + " ".join("{0:>12}".format(c) for c in columns)
+        + " {0:>12}".format("page_faults"))
+    for result in results:
+        stats = result["stats"]
+        frames = max(1, stats["frames"])
+        per_frame = ["{0:12.2f}".format(1000.0 * stats["stages"].get(stage, 0.0) / frames) for stage in columns]
+        page_faults = "{0:12.0f}".format(stats.get("page_faults", 0) / frames)
+        print("{0:<6} {1:<12} {2:<10} {3:7.2f} ".format(result["format"], result["codec"], result["profile"], stats["fps"]) + " ".join(per_frame)
+            + " " + page_faults)
+    print("Stage times are milliseconds per frame. Page faults are per frame.")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark each stage of the daily pipeline on synthetic image sequences.")
+    parser.add_argument("--config", default=os.getenv("DAILIES_CONFIG") or os.path.join(repo_path, "dailies-config.yaml"),
+        help="Dailies config to benchmark. Defaults to $DAILIES_CONFIG or the config next to daily.")
+    parser.add_argument("--formats", nargs="+", default=["exr"], choices=sorted(IMAGE_FORMATS.keys()))
+    parser.add_argument("--width", type=int, default=2048)
+    parser.add_argument("--height", type=int, default=1152)
+    parser.add_argument("--channels", type=int, default=4, help="Number of channels of the synthetic images.")
+    parser.add_argument("--compression", help="Compression of the synthetic images, e.g. zip, piz, dwaa, none.")
+    parser.add_argument("--frames", type=int, default=24)
+    parser.add_argument("--codecs", nargs="+", help="Output codecs to run. Defaults to all output_codecs in the config.")
+    parser.add_argument("--profiles", nargs="+", help="Dailies profiles to run. Defaults to all dailies_profiles in the config.")
+    parser.add_argument("--workdir", help="Directory for the images and movies. Defaults to a temporary directory that is removed afterwards.")
+    parser.add_argument("--output", help="Write the results as json to this file.")
+    args = parser.parse_args()
+
+    with open(args.config) as config_file:
+        config = yaml.safe_load(config_file)
+    codecs = args.codecs or sorted(config["output_codecs"].keys())
+    profiles = args.profiles or sorted(config["dailies_profiles"].keys())
+
+    workdir = args.workdir or tempfile.mkdtemp(prefix="bench_daily_")
+    results = []
+    try:
+        for image_format in args.formats:
+            input_path = generate_sequence(os.path.join(workdir, "images", image_format), image_format,
+                args.width, args.height, args.channels, args.compression, args.frames)
+            for codec in codecs:
+                for profile in profiles:
+                    output_path = os.path.join(workdir, "movies", image_format, codec, profile)
+                    stats = run_daily(config, input_path, codec, profile, output_path)
+                    if stats:
+                        results.append({"format": image_format, "codec": codec, "profile": profile, "stats": stats})
+    finally:
+        if not args.workdir:
+            shutil.rmtree(workdir, ignore_errors=True)
+
+    print_results(results)
+    if args.output:
+        with open(args.output, "w") as output_file:
+            json.dump({
+                "width": args.width,
+                "height": args.height,
+                "channels": args.channels,
+                "compression": args.compression,
+                "frames": args.frames,
+                "results": results,
+                }, output_file, indent=2, sort_keys=True)
+    return 0 if results else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
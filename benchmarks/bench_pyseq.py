@@ -0,0 +1,108 @@
+#!/usr/bin/env python
+"""
+Benchmark pyseq.get_sequences() against the previous grouping algorithm,
+which tested every item against every sequence found so far.
+
+    python benchmarks/bench_pyseq.py
+    python benchmarks/bench_pyseq.py --sizes 1000 10000 100000 --legacy-limit 10000
+"""
+import os, sys
+import time
+import random
+import argparse
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+import pyseq
+
+
+def legacy_get_sequences(items):
+    """
+    The grouping loop of pyseq.get_sequences() before it was made linear: pops each item from the front
+    of the list and tests it against all previous sequences, newest first.
+    """
+    items = sorted(items, key=lambda x: str(x))
+    seqs = []
+    while items:
+        item = pyseq.Item(items.pop(0))
+        found = False
+        for seq in seqs[::-1]:
+            if seq.includes(item):
+                seq.append(item)
+                found = True
+                break
+        if not found:
+            seq = pyseq.Sequence([item])
+            seqs.append(seq)
+    return seqs
+
+
+def generate_names(count, seed=0):
+    """
+    Generate a shuffled list of file names that looks like a render directory: long frame sequences
+    of several shots and versions, unpadded sequences, numbered files that are not sequences, and single files.
+    """
+    rng = random.Random(seed)
+    names = []
+    shot = 0
+    while len(names) < count:
+        kind = rng.random()
+        if kind < 0.6:
+            length = rng.randint(24, 400)
+            for version in range(1, rng.randint(1, 3) + 1):
+                head = "sh{0:04d}_comp_v{1:03d}.".format(shot, version)
+                names += ["{0}{1:04d}.exr".format(head, frame) for frame in range(1001, 1001 + length)]
+        elif kind < 0.7:
+            names += ["sh{0:04d}_plate.{1}.dpx".format(shot, frame) for frame in range(1, rng.randint(2, 200))]
+        elif kind < 0.85:
+            names += ["sh{0:04d}_tile_x{1}_y{2}.{3:04d}.tif".format(shot, x, y, frame)
+                for x in range(2) for y in range(2) for frame in range(1, rng.randint(2, 20))]
+        else:
+            names += ["notes_{0}_{1}.txt".format(shot, rng.randint(0, 10 ** 4)) for i in range(rng.randint(1, 50))]
+            names.append("reference_{0}.mov".format(rng.choice(["front", "side", "top"])))
+        shot += 1
+    names = names[:count]
+    rng.shuffle(names)
+    return [os.path.join("/shots", name) for name in names]
+
+
+def describe(seqs):
+    return [(seq.format('%h%p%t'), [(item.path, item.frame, item.pad, item.head, item.tail) for item in seq])
+        for seq in seqs]
+
+
+def run(function, items, repeat):
+    best = None
+    for i in range(repeat):
+        start = time.time()
+        result = function(items)
+        elapsed = time.time() - start
+        best = elapsed if best is None else min(best, elapsed)
+    return best, result
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark pyseq sequence grouping.")
+    parser.add_argument("--sizes", type=int, nargs="+", default=[1000, 10000, 100000])
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--legacy-limit", type=int, default=100000,
+        help="Skip the previous algorithm for inputs larger than this.")
+    args = parser.parse_args()
+
+    print("{0:>8} {1:>8} {2:>12} {3:>12} {4:>8}".format("items", "seqs", "legacy (s)", "current (s)", "speedup"))
+    for size in args.sizes:
+        items = generate_names(size)
+        current_time, current = run(pyseq.get_sequences, items, args.repeat)
+        if size <= args.legacy_limit:
+            legacy_time, legacy = run(legacy_get_sequences, items, 1)
+            if describe(legacy) != describe(current):
+                print("Sequences differ from the previous algorithm for {0} items".format(size))
+                return 1
+            print("{0:8d} {1:8d} {2:12.3f} {3:12.3f} {4:7.1f}x".format(
+                size, len(current), legacy_time, current_time, legacy_time / current_time))
+        else:
+            print("{0:8d} {1:8d} {2:>12} {3:12.3f} {4:>8}".format(size, len(current), "-", current_time, "-"))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,95 @@
+#!/usr/bin/env python3
+"""
+Benchmark the startup time of daily.
+
+Runs daily with arguments that exit right after setup, with a cold config cache (the compiled config is removed before
+each run) and a warm one, and prints the mean, min and max wall time of each case.
+
+    python3 benchmarks/bench_startup.py --runs 20
+    python3 benchmarks/bench_startup.py --config /path/to/dailies-config.yaml --output results.json
+"""
+import os, sys
+import json
+import time
+import argparse
+import tempfile
+import shutil
+import subprocess
+
+repo_path = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+daily_path = os.path.join(repo_path, "daily")
+
+# Arguments for each case. None of them read images or start ffmpeg.
+CASES = {
+    "help": ["--help"],
+    "bad_codec": ["-c", "no_such_codec", os.getcwd()],
+    "no_sequence": [os.path.join(tempfile.gettempdir(), "bench_startup_missing.%04d.exr")],
+}
+
+
+def time_run(args, env):
+    """
+    Returns:
+        The wall time in seconds of one run of daily.
+    """
+    start = time.time()
+    subprocess.run([sys.executable, daily_path] + args, cwd=repo_path, env=env, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+    return time.time() - start
+
+
+def run_case(args, config_path, cache_dir, runs, warm):
+    """
+    Time daily runs with the config cache in cache_dir. A cold run removes the cache first.
+
+    Returns:
+        A dict of the mean, min and max run time in seconds.
+    """
+    env = dict(os.environ, DAILIES_CONFIG=config_path, DAILIES_CONFIG_CACHE=cache_dir)
+    if warm:
+        time_run(args, env)
+    times = []
+    for run in range(runs):
+        if not warm:
+            shutil.rmtree(cache_dir, ignore_errors=True)
+        times.append(time_run(args, env))
+    return {"mean": sum(times) / len(times), "min": min(times), "max": max(times)}
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark the startup time of daily with a cold and warm config cache.")
+    parser.add_argument("--config", default=os.getenv("DAILIES_CONFIG") or os.path.join(repo_path, "dailies-config.yaml"),
+        help="Dailies config to load. Defaults to $DAILIES_CONFIG or the config next to daily.")
+    parser.add_argument("--runs", type=int, default=10, help="Number of runs of each case.")
+    parser.add_argument("--cases", nargs="+", default=sorted(CASES.keys()), choices=sorted(CASES.keys()))
+    parser.add_argument("--output", help="Write the results as json to this file.")
+    args = parser.parse_args()
+
+    # Python startup alone, for reference
+    start = time.time()
+    for run in range(args.runs):
+        subprocess.run([sys.executable, "-c", "pass"])
+    python_time = (time.time() - start) / args.runs
+
+    cache_dir = tempfile.mkdtemp(prefix="bench_startup_")
+    results = []
+    try:
+        for case in args.cases:
+            for warm in (False, True):
+                timing = run_case(CASES[case], args.config, cache_dir, args.runs, warm)
+                results.append(dict(timing, case=case, cache="warm" if warm else "cold"))
+    finally:
+        shutil.rmtree(cache_dir, ignore_errors=True)
+
+    print("Python startup: {0:.1f} ms".format(1000.0 * python_time))
+    print("{0:<12} {1:<6} {2:>10} {3:>10} {4:>10}".format("case", "cache", "mean ms", "min ms", "max ms"))
+    for result in results:
+        print("{0:<12} {1:<6} {2:10.1f} {3:10.1f} {4:10.1f}".format(
+            result["case"], result["cache"], 1000.0 * result["mean"], 1000.0 * result["min"], 1000.0 * result["max"]))
+    if args.output:
+        with open(args.output, "w") as output_file:
+            json.dump({"runs": args.runs, "python": python_time, "results": results}, output_file, indent=2, sort_keys=True)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,79 @@
+#!/usr/bin/env python3
+"""
+Benchmark the vectorized timecode API in tc.Timecode against the scalar one.
+
+For each framerate, converts a range of frames to timecode strings with frames_to_tc and tc_to_string one frame at a
+time, and with frames_to_tc_array and tc_to_string_array in one pass, and prints the time of each. The vectorized
+results are checked against the scalar ones by tests/test_tc.py.
+
+    python3 benchmarks/bench_timecode.py --frames 1000000
+    python3 benchmarks/bench_timecode.py --framerates 24 29.97 --fractional --output results.json
+"""
+import os, sys
+import json
+import time
+import argparse
+
+import numpy as np
+
+repo_path = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, repo_path)
+from tc import Timecode
+
+FRAMERATES = ["23.98", "24", "25", "29.97", "30", "50", "59.94", "60", "ms"]
+
+
+def make_timecode(framerate, fractional):
+    timecode = Timecode(framerate, start_timecode="00:00:00:00")
+    timecode.set_fractional(fractional)
+    return timecode
+
+
+def time_scalar(timecode, frames):
+    start = time.time()
+    strings = [timecode.tc_to_string(*timecode.frames_to_tc(frame)) for frame in range(1, frames + 1)]
+    return time.time() - start
+
+
+def time_vectorized(timecode, frames):
+    start = time.time()
+    strings = timecode.tc_to_string_array(*timecode.frames_to_tc_array(np.arange(1, frames + 1)))
+    return time.time() - start
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark the vectorized timecode API against the scalar one.")
+    parser.add_argument("--frames", type=int, default=1000000, help="Number of frames to convert.")
+    parser.add_argument("--framerates", nargs="+", default=FRAMERATES)
+    parser.add_argument("--fractional", action="store_true", help="Also run every framerate in fractional mode.")
+    parser.add_argument("--output", help="Write the results as json to this file.")
+    args = parser.parse_args()
+
+    modes = [False, True] if args.fractional else [False]
+    results = []
+    for framerate in args.framerates:
+        for fractional in modes:
+            if fractional and framerate == "ms":
+                continue
+            timecode = make_timecode(framerate, fractional)
+            results.append({
+                "framerate": framerate,
+                "fractional": fractional,
+                "scalar": time_scalar(timecode, args.frames),
+                "vectorized": time_vectorized(timecode, args.frames),
+                })
+
+    print("{0} frames".format(args.frames))
+    print("{0:<10} {1:<10} {2:>10} {3:>10} {4:>8}".format("framerate", "fractional", "scalar s", "vector s", "speedup"))
+    for result in results:
+        print("{0:<10} {1:<10} {2:10.3f} {3:10.3f} {4:8.1f}".format(
+            result["framerate"], str(result["fractional"]), result["scalar"], result["vectorized"],
+            result["scalar"] / max(result["vectorized"], 1e-9)))
+    if args.output:
+        with open(args.output, "w") as output_file:
+            json.dump({"frames": args.frames, "results": results}, output_file, indent=2, sort_keys=True)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
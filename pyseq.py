@@ -53,6 +53,8 @@ import re
 import logging
 import warnings
 import functools
+from array import array
+from bisect import bisect_left
 from glob import glob
 from glob import iglob
 from datetime import datetime
@@ -77,8 +79,8 @@ format_re = re.compile(r'%(?P<pad>\d+)?(?P<var>\w+)')
 range_join = os.environ.get('PYSEQ_RANGE_SEP', ', ')
 
 __all__ = [
-    'SequenceError', 'FormatError', 'Item', 'Sequence', 'diff', 'uncompress',
-    'getSequences', 'get_sequences', 'walk'
+    'SequenceError', 'FormatError', 'Item', 'Sequence', 'CompactSequence',
+    'compact', 'diff', 'uncompress', 'getSequences', 'get_sequences', 'walk'
 ]
 
 # logging handlers
@@ -331,15 +333,13 @@ class Sequence(list):
 
         :return: pyseq.Sequence class instance.
         """
-        # otherwise Sequence consumes the list
-        items = items[::]
-        super(Sequence, self).__init__([Item(items.pop(0))])
+        super(Sequence, self).__init__([Item(items[0])])
         self.__missing = []
         self.__dirty = False
         self.__frames = None
 
-        while items:
-            f = Item(items.pop(0))
+        for item in items[1:]:
+            f = Item(item)
             try:
                 self.append(f)
                 log.debug('+Item belongs to sequence.')
@@ -638,6 +638,25 @@ class Sequence(list):
         else:
             raise SequenceError('Item is not a member of this sequence')
 
+    def _append_sibling(self, item, start, end):
+        """Adds an item that is known to be a sibling of the last member, and
+        to differ from it only in the number between start and end. Updates
+        both items the way Item.is_sibling() does.
+
+        :param item: pyseq.Item object.
+        :param start: index of the first character of the frame number.
+        :param end: index after the last character of the frame number.
+        """
+        for sibling in (self[-1], item):
+            frame = sibling.name[start:end]
+            sibling.frame = int(frame)
+            sibling.pad = len(frame)
+            sibling.head = sibling.name[:start]
+            sibling.tail = sibling.name[end:]
+        super(Sequence, self).append(item)
+        self.__frames = None
+        self.__missing = None
+
     def insert(self, index, item):
         """ Add another member to the sequence at the given index.
             :param item: pyseq.Item object.
@@ -783,6 +802,203 @@ class Sequence(list):
         return sorted(list(set(frames).symmetric_difference(r)))
 
 
+class CompactSequence(object):
+    """Read-only sequence of numbered files, stored as a directory, head, tail,
+    padding and an array of frame numbers instead of one Item per file.
+
+    Items are only built when the sequence is indexed or iterated, and
+    start(), end() and length() are answered from the frame array.
+
+        >>> s = CompactSequence('/shots', 'file.', '.jpg', 4, [1, 2, 3, 6])
+        >>> print(s)
+        file.1-6.jpg
+        >>> print(s.format('%4l %h%p%t %R'))
+           4 file.%04d.jpg [1-3, 6]
+        >>> s[-1].name
+        'file.0006.jpg'
+
+    :param dirname: Directory of the files.
+    :param head: String before the frame number.
+    :param tail: String after the frame number.
+    :param pad: Number of digits of the frame number.
+    :param frames: Frame numbers.
+    """
+
+    def __init__(self, dirname, head, tail, pad, frames):
+        self.__dirname = os.path.abspath(dirname)
+        self.__head = head
+        self.__tail = tail
+        self.__pad = pad
+        frames = sorted(frames)
+        try:
+            self.__frames = array('i', frames)
+        except OverflowError:
+            self.__frames = array('q', frames)
+        self.__missing = None
+
+    def __attrs__(self):
+        """Replaces format directives with callables to get their values."""
+        return {
+            'l': self.length,
+            's': self.start,
+            'e': self.end,
+            'f': self.frames,
+            'm': self.missing,
+            'M': functools.partial(self._get_framerange, self.missing(), missing=True),
+            'd': lambda *x: self.size,
+            'D': self.directory,
+            'p': self._get_padding,
+            'r': functools.partial(self._get_framerange, self.frames(), missing=False),
+            'R': functools.partial(self._get_framerange, self.frames(), missing=True),
+            'h': self.head,
+            't': self.tail
+        }
+
+    format = Sequence.format
+    _get_framerange = Sequence._get_framerange
+
+    def __str__(self):
+        return self.format(default_format)
+
+    def __repr__(self):
+        return '<pyseq.CompactSequence "%s">' % str(self)
+
+    def __len__(self):
+        return len(self.__frames)
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return [self._get_item(frame) for frame in self.__frames[index]]
+        return self._get_item(self.__frames[index])
+
+    def __iter__(self):
+        for frame in self.__frames:
+            yield self._get_item(frame)
+
+    def __getattr__(self, key):
+        if key.startswith('_'):
+            raise AttributeError(key)
+        return getattr(self[0], key)
+
+    def __contains__(self, item):
+        if not isinstance(item, Item):
+            item = Item(item)
+        if item.dirname != self.__dirname:
+            return False
+        name = item.name
+        if not name.startswith(self.__head) or not name.endswith(self.__tail):
+            return False
+        number = name[len(self.__head):len(name) - len(self.__tail)]
+        if not number.isdigit():
+            return False
+        frame = int(number)
+        index = bisect_left(self.__frames, frame)
+        return index < len(self.__frames) and self.__frames[index] == frame \
+            and self._get_name(frame) == name
+
+    def _get_name(self, frame):
+        return '%s%0*d%s' % (self.__head, self.__pad, frame, self.__tail)
+
+    def _get_item(self, frame):
+        name = self._get_name(frame)
+        item = Item(os.path.join(self.__dirname, name))
+        item.frame = frame
+        item.pad = len(name) - len(self.__head) - len(self.__tail)
+        item.head = self.__head
+        item.tail = self.__tail
+        return item
+
+    def _get_padding(self):
+        """:return: padding string, e.g. %07d"""
+        if self.__pad < 2:
+            return '%d'
+        return '%%%02dd' % self.__pad
+
+    @property
+    def mtime(self):
+        """Returns the latest mtime of all items
+        """
+        return max(item.mtime for item in self)
+
+    @property
+    def size(self):
+        """Returns the size all items (divide by 1024*1024 for MBs)
+        """
+        return sum(item.size for item in self)
+
+    @property
+    def dirname(self):
+        """Directory of the sequence."""
+        return self.__dirname
+
+    @property
+    def pad(self):
+        """Number of digits of the frame number."""
+        return self.__pad
+
+    def directory(self):
+        return self.__dirname + os.sep
+
+    def length(self):
+        """:return: The length of the sequence."""
+        return len(self.__frames)
+
+    def frames(self):
+        """:return: Sorted array of the frame numbers in the sequence."""
+        return self.__frames
+
+    def start(self):
+        """:return: First index number in sequence
+        """
+        return self.__frames[0] if self.__frames else 0
+
+    def end(self):
+        """:return: Last index number in sequence
+        """
+        return self.__frames[-1] if self.__frames else 0
+
+    def missing(self):
+        """:return: List of missing frame numbers."""
+        if self.__missing is None:
+            frames = self.__frames
+            self.__missing = [frame
+                              for i in range(1, len(frames))
+                              for frame in range(frames[i - 1] + 1, frames[i])]
+        return self.__missing
+
+    def head(self):
+        """:return: String before the sequence index number."""
+        return self.__head
+
+    def tail(self):
+        """:return: String after the sequence index number."""
+        return self.__tail
+
+    def path(self):
+        """:return: Absolute path to sequence."""
+        return os.path.join(self.__dirname, str(self))
+
+
+def compact(seq):
+    """Converts a Sequence to a CompactSequence.
+
+    :param seq: pyseq.Sequence object.
+
+    :return: pyseq.CompactSequence object, or seq itself if its items can not
+        be rebuilt from a head, tail, padding and frame number, like single
+        files without a number, or items in several directories.
+    """
+    if isinstance(seq, CompactSequence) or not len(seq) or seq[0].pad is None:
+        return seq
+    first = seq[0]
+    result = CompactSequence(first.dirname, first.head, first.tail, first.pad,
+                             [item.frame for item in seq])
+    for item, frame in zip(seq, result.frames()):
+        if item.path != os.path.join(result.dirname, result._get_name(frame)):
+            return seq
+    return result
+
+
 def diff(f1, f2):
     """Examines diffs between f1 and f2 and deduces numerical sequence number.
 
@@ -991,6 +1207,109 @@ def getSequences(source):
     return get_sequences(source)
 
 
+def _sibling_keys(item):
+    """Returns the keys under which the siblings of item are found: one key per
+    number in the name, made of the name parts and the other numbers.
+
+    :param item: pyseq.Item object.
+
+    :return: Tuple of (parts, lengths, keys, spans), where spans are the
+        (start, end) positions of the numbers in the name.
+    """
+    parts = tuple(item.parts)
+    digits = tuple(item.digits)
+    lengths = tuple(len(d) for d in digits)
+    keys = []
+    spans = []
+    end = 0
+    for i, d in enumerate(digits):
+        keys.append((parts, lengths, i, digits[:i], digits[i + 1:]))
+        start = end + len(parts[i])
+        end = start + len(d)
+        spans.append((start, end))
+    return parts, lengths, keys, spans
+
+
+def _group_items(items):
+    """Organizes sorted items into sequences.
+
+    Gives the same result as testing each item against every sequence found so
+    far, newest first, with Sequence.includes(). Instead of scanning all the
+    sequences, each item only looks up the sequences whose last item has the
+    same name parts and differs from it in exactly one number. Only sequences
+    whose last item has numbers of other lengths, which can still be siblings
+    when a padding difference is skipped by diff(), are tested with
+    Sequence.includes().
+
+    :param items: Sorted list of paths or objects.
+
+    :return: List of pyseq.Sequence class objects.
+    """
+    seqs = []
+    # sibling key -> indices of the sequences whose last item has that key
+    keys = {}
+    # name parts -> number lengths -> indices of the sequences whose last item has them
+    shapes = {}
+    # index -> sibling keys of the last item of that sequence
+    last_keys = []
+    paths = set()
+
+    for item in items:
+        item = Item(item)
+        parts, lengths, item_keys, spans = _sibling_keys(item)
+
+        match = -1
+        # number that differs from the last item of the matching sequence,
+        # or None if the match was found with Sequence.includes()
+        number = None
+        if item.path in paths:
+            # Sequence.includes() treats an item with the same path as the
+            # last one differently, so duplicates are tested the slow way
+            for index in range(len(seqs) - 1, -1, -1):
+                if seqs[index].includes(item):
+                    match = index
+                    break
+        else:
+            paths.add(item.path)
+            for i, key in enumerate(item_keys):
+                for index in keys.get(key, ()):
+                    if index > match and seqs[index][-1].digits[i] != item.digits[i]:
+                        match = index
+                        number = i
+            # is_sibling() updates both items when it succeeds, so these are
+            # tested newest first, and only until one matches, like a full scan
+            candidates = [index
+                          for other_lengths, indices in shapes.get(parts, {}).items()
+                          if other_lengths != lengths
+                          for index in indices if index > match]
+            for index in sorted(candidates, reverse=True):
+                if seqs[index].includes(item):
+                    match = index
+                    number = None
+                    break
+
+        if match < 0:
+            seqs.append(Sequence([item]))
+            last_keys.append(None)
+            match = len(seqs) - 1
+        else:
+            if number is None:
+                seqs[match].append(item)
+            else:
+                seqs[match]._append_sibling(item, *spans[number])
+            old_parts, old_lengths, old_keys = last_keys[match]
+            for key in old_keys:
+                keys[key].discard(match)
+            shapes[old_parts][old_lengths].discard(match)
+
+        last_keys[match] = (parts, lengths, item_keys)
+        for key in item_keys:
+            keys.setdefault(key, set()).add(match)
+        shapes.setdefault(parts, {}).setdefault(lengths, set()).add(match)
+
+    return seqs
+
+
 def get_sequences(source):
     """Returns a list of Sequence objects given a directory or list that contain
     sequential members.
@@ -1038,9 +1357,6 @@ def get_sequences(source):
     """
     start = datetime.now()
 
-    # list for storing sequences to be returned later
-    seqs = []
-
     if isinstance(source, list):
         items = sorted(source, key=lambda x: str(x))
 
@@ -1056,21 +1372,11 @@ def get_sequences(source):
     log.debug('Found %s files' % len(items))
 
     # organize the items into sequences
-    while items:
-        item = Item(items.pop(0))
-        found = False
-        for seq in seqs[::-1]:
-            if seq.includes(item):
-                seq.append(item)
-                found = True
-                break
-        if not found:
-            seq = Sequence([item])
-            seqs.append(seq)
+    seqs = _group_items(items)
 
     log.debug('time: %s' % (datetime.now() - start))
 
-    return list(seqs)
+    return seqs
 
 
 def iget_sequences(source):
@@ -1137,8 +1443,8 @@ def iget_sequences(source):
     log.debug("Found %d files", len(items))
 
     seq = None
-    while items:
-        item = Item(items.pop(0))
+    for item in items:
+        item = Item(item)
         if seq is None:
             seq = Sequence([item])
         elif seq.includes(item):
@@ -278,6 +278,137 @@ class Timecode(object):
                                             self.frame_delimiter,
                                             frs)
 
+    def frames_to_tc_array(self, frames):
+        """Converts an array of frames to timecode in one vectorized pass.
+        Same as :meth:`.frames_to_tc` for each frame.
+
+        :param frames: NumPy array or sequence of 1 based frame numbers
+        :returns tuple: NumPy arrays of hours, minutes, seconds and frames.
+          Frames are fractions of a second if :attr:`.fraction_frame` is set
+        """
+        import numpy as np
+
+        ffps = float(self._framerate)
+
+        if self.drop_frame:
+            drop_frames = int(round(ffps * .066666))
+        else:
+            drop_frames = 0
+
+        frames_per_hour = int(round(ffps * 60 * 60))
+        frames_per_24_hours = frames_per_hour * 24
+        frames_per_10_minutes = int(round(ffps * 60 * 10))
+        frames_per_minute = int(round(ffps) * 60) - drop_frames
+
+        # Negative times and times over 24 hours roll over the clock
+        frame_number = np.mod(np.asarray(frames, dtype=np.int64) - 1,
+                              frames_per_24_hours)
+
+        if self.drop_frame:
+            d = frame_number // frames_per_10_minutes
+            m = frame_number % frames_per_10_minutes
+            dropped = drop_frames * 9 * d
+            dropped += np.where(
+                m > drop_frames,
+                drop_frames * ((m - drop_frames) // frames_per_minute),
+                0
+            )
+            frame_number = frame_number + dropped
+
+        ifps = self._int_framerate
+
+        frs = frame_number % ifps
+        if self.fraction_frame:
+            frs = np.round(frs / float(ifps), 3)
+
+        total_secs = frame_number // ifps
+        secs = total_secs % 60
+        mins = (total_secs // 60) % 60
+        hrs = (total_secs // 60) // 60
+
+        return hrs, mins, secs, frs
+
+    def tc_to_string_array(self, hrs, mins, secs, frs):
+        """Formats arrays of timecode components as strings in one
+        vectorized pass. Same as :meth:`.tc_to_string` for each timecode.
+
+        :returns: NumPy array of unicode strings
+        """
+        import numpy as np
+
+        hrs, mins, secs = [np.asarray(a, dtype=np.int64)
+                           for a in (hrs, mins, secs)]
+        if self.fraction_frame:
+            # 'ss.fff': seconds and milliseconds
+            millis = np.rint((secs + np.asarray(frs)) * 1000).astype(np.int64)
+            secs, frs = millis // 1000, millis % 1000
+            frame_digits = 3
+            delimiter = '.'
+        else:
+            frs = np.asarray(frs, dtype=np.int64)
+            frame_digits = 3 if self.ms_frame else 2
+            delimiter = self.frame_delimiter
+
+        # Write the ASCII digits of each field into the columns of a
+        # character array, then view each row as one string
+        fields = [(hrs, 2), (mins, 2), (secs, 2), (frs, frame_digits)]
+        width = sum(digits for value, digits in fields) + len(fields) - 1
+        chars = np.empty((hrs.size, width), dtype=np.uint8)
+        column = 0
+        for index, (value, digits) in enumerate(fields):
+            value = value.reshape(-1)
+            for digit in range(digits):
+                power = 10 ** (digits - 1 - digit)
+                chars[:, column] = ord('0') + (value // power) % 10
+                column += 1
+            if index < len(fields) - 1:
+                chars[:, column] = ord(delimiter if index == 2 else ':')
+                column += 1
+
+        strings = chars.view('S%d' % width).reshape(hrs.shape)
+        return strings.astype('U%d' % width)
+
+    def tc_to_frames_array(self, hrs, mins, secs, frs):
+        """Converts arrays of timecode components to frames in one
+        vectorized pass. Same as :meth:`.tc_to_frames` for each timecode,
+        for non fractional timecodes.
+
+        :returns: NumPy array of 1 based frame numbers
+        """
+        import numpy as np
+
+        hrs, mins, secs, frs = [np.asarray(a, dtype=np.int64)
+                                for a in (hrs, mins, secs, frs)]
+        ffps = float(self._framerate)
+
+        if self.drop_frame:
+            drop_frames = int(round(ffps * .066666))
+        else:
+            drop_frames = 0
+
+        ifps = self._int_framerate
+        total_minutes = (60 * hrs) + mins
+
+        frame_number = \
+            ((ifps * 60 * 60 * hrs) + (ifps * 60 * mins) +
+             (ifps * secs) + frs) - \
+            (drop_frames * (total_minutes - (total_minutes // 10)))
+
+        return frame_number + 1
+
+    def tc_range(self, count, step=1):
+        """Returns the timecode strings of count frames, starting at the
+        current timecode. Used for per frame timecode burn-ins and exports.
+
+        :param int count: Number of timecodes
+        :param int step: Number of frames between timecodes
+        :returns: NumPy array of unicode strings
+        """
+        import numpy as np
+
+        frames = self.frames + step * np.arange(count, dtype=np.int64)
+        return self.tc_to_string_array(*self.frames_to_tc_array(frames))
+
     @classmethod
     def parse_timecode(cls, timecode):
         """parses timecode string NDF '00:00:00:00' or DF '00:00:00;00' or
@@ -0,0 +1,29 @@
+"""
+Shared fixtures. The daily script has no .py extension, so it is loaded from its path as the "daily" module.
+"""
+import importlib.machinery
+import importlib.util
+import os
+import sys
+
+import pytest
+
+REPO = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if REPO not in sys.path:
+    sys.path.insert(0, REPO)
+
+
+def load_daily():
+    if 'daily' in sys.modules:
+        return sys.modules['daily']
+    loader = importlib.machinery.SourceFileLoader('daily', os.path.join(REPO, 'daily'))
+    spec = importlib.util.spec_from_loader('daily', loader)
+    module = importlib.util.module_from_spec(spec)
+    sys.modules['daily'] = module
+    loader.exec_module(module)
+    return module
+
+
+@pytest.fixture
+def daily():
+    return load_daily()
@@ -0,0 +1,65 @@
+import queue
+
+import pytest
+
+from tc import Timecode
+
+
+@pytest.mark.parametrize("length, chunk_frames, expected", [
+    (100, 48, [(0, 48), (48, 96), (96, 100)]),
+    (96, 48, [(0, 48), (48, 96)]),
+    (10, 48, [(0, 10)]),
+    (1, 1, [(0, 1)]),
+    ])
+def test_chunk_ranges(daily, length, chunk_frames, expected):
+    chunks = daily.GenerateDaily.chunk_ranges(length, chunk_frames)
+    assert chunks == expected
+    # Every frame is in exactly one chunk, in order
+    assert [frame for first, last in chunks for frame in range(first, last)] == list(range(length))
+
+
+def make_chunk_encoder(daily, tmp_path, start_timecode):
+    generator = daily.GenerateDaily.__new__(daily.GenerateDaily)
+    generator.movie_fullpath = str(tmp_path / "plates.mov")
+    generator.start_tc = Timecode("24", start_timecode=start_timecode)
+    generator.globals_config = {}
+    generator.failed_sequences = []
+    generator.setup_ffmpeg = lambda: "ffmpeg -timecode {0}".format(generator.start_tc)
+    generator.encoded = []
+
+    def encode(targets, first, last):
+        generator.encoded.append((targets, first, last))
+        if generator.progress_callback:
+            generator.progress_callback(5, None)
+    generator.encode = encode
+    return generator
+
+
+def test_encode_chunk_timecode(daily, tmp_path):
+    chunk_path = str(tmp_path / "plates.chunks" / "chunk.0002.mov")
+    progress = queue.Queue()
+    generator = make_chunk_encoder(daily, tmp_path, "01:00:00:00")
+    generator.encode_chunk(96, 100, chunk_path, 2, progress)
+
+    # The chunk starts at the timecode of its first frame in the whole movie
+    assert str(generator.start_tc) == "01:00:04:00"
+    ((targets, first, last),) = generator.encoded
+    assert targets == [(generator, "ffmpeg -timecode 01:00:04:00")]
+    assert (first, last) == (96, 100)
+    assert generator.movie_fullpath == chunk_path
+    assert generator.globals_config['write_stats']
+    assert progress.get_nowait() == (2, 5, 4)
+
+
+def test_encode_chunk_timecode_rollover(daily, tmp_path):
+    generator = make_chunk_encoder(daily, tmp_path, "23:59:59:00")
+    generator.encode_chunk(48, 72, str(tmp_path / "chunk.0001.mov"))
+    assert str(generator.start_tc) == "00:00:01:00"
+
+
+def test_encode_chunk_failure_exits(daily, tmp_path):
+    generator = make_chunk_encoder(daily, tmp_path, "01:00:00:00")
+    generator.failed_sequences = ["plates"]
+    with pytest.raises(SystemExit) as exit_info:
+        generator.encode_chunk(0, 48, str(tmp_path / "chunk.0000.mov"))
+    assert exit_info.value.code == 1
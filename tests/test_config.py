@@ -0,0 +1,64 @@
+import os
+import pickle
+import shutil
+
+import pytest
+
+from conftest import REPO
+
+
+@pytest.fixture
+def config_path(daily, tmp_path, monkeypatch):
+    path = str(tmp_path / "dailies-config.yaml")
+    shutil.copy(os.path.join(REPO, "dailies-config.yaml"), path)
+    monkeypatch.setattr(daily, '_loaded_configs', {})
+    return path
+
+
+def cache_files(cache_dir):
+    return sorted(name for name in os.listdir(cache_dir) if name.endswith(".pickle")) if os.path.isdir(cache_dir) else []
+
+
+def test_config_not_cached_by_default(daily, config_path, tmp_path, monkeypatch):
+    monkeypatch.delenv("DAILIES_CONFIG_CACHE", raising=False)
+    monkeypatch.setenv("HOME", str(tmp_path / "home"))
+    config, codec_errors = daily.load_config(config_path)
+    assert 'globals' in config
+    assert not os.path.exists(str(tmp_path / "home"))
+
+
+def test_config_cache(daily, config_path, tmp_path, monkeypatch):
+    cache_dir = str(tmp_path / "cache")
+    monkeypatch.setenv("DAILIES_CONFIG_CACHE", cache_dir)
+    config, codec_errors = daily.load_config(config_path)
+    (cache_name,) = cache_files(cache_dir)
+    cache_path = os.path.join(cache_dir, cache_name)
+    assert os.stat(cache_dir).st_mode & 0o777 == 0o700
+    assert os.stat(cache_path).st_mode & 0o777 == 0o600
+
+    # A warm start reads the cache
+    with open(cache_path, 'rb') as cache_file:
+        cached = pickle.load(cache_file)
+    cached['config']['globals']['from_cache'] = True
+    with open(cache_path, 'wb') as cache_file:
+        pickle.dump(cached, cache_file)
+    monkeypatch.setattr(daily, '_loaded_configs', {})
+    assert daily.load_config(config_path)[0]['globals'].get('from_cache')
+
+
+def test_config_cache_writable_by_others(daily, config_path, tmp_path, monkeypatch):
+    cache_dir = str(tmp_path / "cache")
+    monkeypatch.setenv("DAILIES_CONFIG_CACHE", cache_dir)
+    daily.load_config(config_path)
+    (cache_name,) = cache_files(cache_dir)
+    cache_path = os.path.join(cache_dir, cache_name)
+    with open(cache_path, 'rb') as cache_file:
+        cached = pickle.load(cache_file)
+    cached['config']['globals']['from_cache'] = True
+    with open(cache_path, 'wb') as cache_file:
+        pickle.dump(cached, cache_file)
+
+    # Another user could have written the cache: it is parsed again, not unpickled
+    os.chmod(cache_dir, 0o777)
+    monkeypatch.setattr(daily, '_loaded_configs', {})
+    assert not daily.load_config(config_path)[0]['globals'].get('from_cache')
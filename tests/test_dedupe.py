@@ -0,0 +1,94 @@
+import concurrent.futures
+import os
+import threading
+import time
+import types
+
+import numpy as np
+
+
+class SlowCopyBuf(object):
+    """
+    Stands in for an oiio.ImageBuf. Copies are slow, so a frame modifying the buffer in place while another
+    frame is still copying it gives the copy the wrong pixels.
+    """
+
+    def __init__(self, pixels):
+        self.pixels = pixels
+
+    def copy(self):
+        time.sleep(0.02)
+        return SlowCopyBuf(self.pixels.copy())
+
+    def get_pixels(self, format=None):
+        return self.pixels.copy()
+
+
+class CounterTarget(object):
+    """
+    A render target whose framecounter adds the frame number to the pixels.
+    """
+    yuv_converter = None
+    jpeg_options = None
+    pixel_data_type = None
+
+    def composite_frame(self, frame, buf, frame_stats):
+        buf.pixels += frame.frame
+        return buf
+
+
+def make_renderer(daily, groups=1):
+    renderer = daily.GenerateDaily.__new__(daily.GenerateDaily)
+    renderer.render_targets = [CounterTarget() for group in range(groups)]
+    renderer.target_groups = [[index] for index in range(groups)]
+
+    def reformat_groups(frame):
+        time.sleep(0.01)
+        return [SlowCopyBuf(np.zeros(4, np.float32)) for group in range(groups)], [{} for group in range(groups)], None
+    renderer.reformat_groups = reformat_groups
+    return renderer
+
+
+def make_held_run(tmp_path, count):
+    # Hard links of one file are the same frame, without hashing
+    source = tmp_path / "held.1001.exr"
+    source.write_bytes(b"exr")
+    frames = []
+    for index in range(count):
+        path = tmp_path / "held.{0}.exr".format(1001 + index)
+        if index:
+            os.link(str(source), str(path))
+        frames.append(types.SimpleNamespace(path=str(path), frame=1001 + index))
+    return frames
+
+
+def test_held_run_frame_counters(daily, tmp_path):
+    frames = make_held_run(tmp_path, 6)
+    for groups in (1, 2):
+        renderer = make_renderer(daily, groups)
+        deduper = daily.FrameDeduper()
+        with concurrent.futures.ThreadPoolExecutor(4) as pool:
+            futures = [(frame, pool.submit(renderer.render_frame, frame, held)) for frame, held in deduper.frames(frames)]
+            for frame, future in futures:
+                for pixels, frame_stats in future.result():
+                    assert list(pixels) == [frame.frame] * 4
+
+
+def test_held_run_shares_reformat(daily, tmp_path):
+    frames = make_held_run(tmp_path, 4)
+    renderer = make_renderer(daily)
+    reformat = renderer.reformat_groups
+    calls = []
+    lock = threading.Lock()
+
+    def counted(frame):
+        with lock:
+            calls.append(frame.frame)
+        return reformat(frame)
+    renderer.reformat_groups = counted
+    deduper = daily.FrameDeduper()
+    with concurrent.futures.ThreadPoolExecutor(3) as pool:
+        futures = [pool.submit(renderer.render_frame, frame, held) for frame, held in deduper.frames(frames)]
+        results = [future.result() for future in futures]
+    assert calls == [1001]
+    assert [rendered[0][1].get('dedupe_hits', 0) for rendered in results] == [0, 1, 1, 1]
@@ -0,0 +1,57 @@
+import subprocess
+
+import numpy as np
+import pytest
+
+
+def start_encoder(daily, script):
+    ffproc = subprocess.Popen(["sh", "-c", script], stdin=subprocess.PIPE, stdout=subprocess.PIPE, bufsize=0)
+    return daily.FrameWriter(ffproc)
+
+
+def test_frame_writer_exit_status(daily):
+    writer = start_encoder(daily, "cat > /dev/null")
+    writer.put(np.zeros(1024, np.uint16))
+    writer.close()
+    writer.wait()
+    assert writer.ffproc.returncode == 0
+
+    writer = start_encoder(daily, "cat > /dev/null; exit 3")
+    writer.put(np.zeros(1024, np.uint16))
+    writer.close()
+    writer.wait()
+    assert writer.ffproc.returncode == 3
+
+
+def test_mark_failed(daily):
+    generator = daily.GenerateDaily.__new__(daily.GenerateDaily)
+    generator.failed_sequences = []
+    generator.errors = []
+    generator.image_sequence = ["shot.1001.exr"]
+    generator.mark_failed("ffmpeg exited with status 1")
+    generator.mark_failed("Could not join chunks")
+    assert generator.failed_sequences == [["shot.1001.exr"]]
+    assert generator.errors == ["ffmpeg exited with status 1", "Could not join chunks"]
+
+
+def make_targets(daily, count, cpu_budget):
+    primary = daily.GenerateDaily.__new__(daily.GenerateDaily)
+    primary.targets = []
+    for index in range(count):
+        target = daily.GenerateDaily.__new__(daily.GenerateDaily)
+        target.globals_config = {'cpu_budget': cpu_budget}
+        primary.targets.append(target)
+    primary.globals_config = primary.targets[0].globals_config
+    return primary
+
+
+@pytest.mark.parametrize("count, cpu_budget, jobs", [(1, 8, 8), (1, 16, 4), (2, 8, 2), (3, 8, 4), (3, 16, 2), (2, 2, 1)])
+def test_share_cpu_budget(daily, count, cpu_budget, jobs):
+    primary = make_targets(daily, count, cpu_budget)
+    jobs = primary.share_cpu_budget(jobs)
+    workers = set(target.globals_config['workers'] for target in primary.targets)
+    assert len(workers) == 1
+    job_cpus = workers.pop() + sum(target.ffmpeg_threads for target in primary.targets)
+    assert all(target.ffmpeg_threads >= 1 for target in primary.targets)
+    # Every target's encoder is capped, and the jobs stay within the budget unless one job needs more
+    assert jobs * job_cpus <= max(cpu_budget, count + 1)
@@ -0,0 +1,41 @@
+import os
+import time
+
+import pyseq
+
+
+def write_frames(directory, frames, age=10.0):
+    # Frames written a while ago are complete without waiting for them to settle
+    mtime = time.time() - age
+    for frame in frames:
+        path = os.path.join(str(directory), "render.{0:04d}.exr".format(frame))
+        with open(path, 'wb') as image_file:
+            image_file.write(b"exr")
+        os.utime(path, (mtime, mtime))
+
+
+def follow(daily, directory, end_frame=None):
+    follower = daily.FrameFollower(end_frame, timeout=0.2, settle=0.1, poll_interval=0.02)
+    image_sequence = pyseq.get_sequences(str(directory))[0]
+    return follower, [frame.frame for frame in follower.frames(image_sequence)]
+
+
+def test_follow_to_end(daily, tmp_path):
+    write_frames(tmp_path, range(1001, 1005))
+    follower, frames = follow(daily, tmp_path)
+    assert frames == [1001, 1002, 1003, 1004]
+    assert follower.missing_frame is None
+
+
+def test_follow_gap_cuts_movie_short(daily, tmp_path):
+    write_frames(tmp_path, [1001, 1002, 1004, 1005])
+    follower, frames = follow(daily, tmp_path)
+    assert frames == [1001, 1002]
+    assert follower.missing_frame == 1003
+
+
+def test_follow_missing_before_end_frame(daily, tmp_path):
+    write_frames(tmp_path, range(1001, 1004))
+    follower, frames = follow(daily, tmp_path, end_frame=1010)
+    assert frames == [1001, 1002, 1003]
+    assert follower.missing_frame == 1004
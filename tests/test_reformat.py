@@ -0,0 +1,42 @@
+import types
+
+import pytest
+
+
+class ROI(object):
+    def __init__(self, xbegin, xend, ybegin, yend):
+        self.xbegin, self.xend, self.ybegin, self.yend = xbegin, xend, ybegin, yend
+
+
+def make_spec(width, height):
+    return types.SimpleNamespace(x=0, y=0, width=width, height=height, full_x=0, full_y=0,
+        full_width=width, full_height=height, format="float")
+
+
+@pytest.fixture
+def plan_class(daily, monkeypatch):
+    monkeypatch.setattr(daily, 'oiio', types.SimpleNamespace(ROI=ROI))
+    return daily.ReformatPlan
+
+
+def test_plan_size(plan_class):
+    plan = plan_class(make_spec(4096, 2160), 1.0, width=1920, height=1080, fit=True, cropwidth="10%")
+    assert (plan.width, plan.height) == (1920, 1080)
+    assert plan.scaled_height == 1920 * 2160 // 3687
+    assert plan.resample
+
+
+def test_plan_empty_output(plan_class):
+    # A very wide region resized to a small width has no rows left
+    with pytest.raises(ValueError, match="empty 100x0 frame"):
+        plan_class(make_spec(8000, 40), 1.0, width=100)
+
+
+def test_plan_empty_input(plan_class):
+    with pytest.raises(ValueError, match="no pixels"):
+        plan_class(make_spec(1920, 0), 1.0, width=1920, height=1080)
+
+
+def test_plan_crop_leaves_no_pixels(plan_class):
+    with pytest.raises(ValueError, match="leaves no pixels"):
+        plan_class(make_spec(1920, 1080), 1.0, width=1920, cropwidth="100%")
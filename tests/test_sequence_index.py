@@ -0,0 +1,45 @@
+import json
+import os
+import time
+
+
+def make_directory(path, frames):
+    os.makedirs(str(path))
+    for frame in frames:
+        (path / "plate.{0:04d}.exr".format(frame)).write_bytes(b"exr")
+    # Directories modified during the settle time are not indexed
+    mtime = time.time() - 10
+    os.utime(str(path), (mtime, mtime))
+
+
+def test_index_round_trip(daily, tmp_path):
+    make_directory(tmp_path / "shot", [1001, 1002, 1003, 1005])
+    index_path = str(tmp_path / "index.json")
+    index = daily.SequenceIndex(index_path)
+    sequences = index.get_sequences(str(tmp_path / "shot"))
+    index.save()
+
+    entry = json.load(open(index_path))[str(tmp_path / "shot")]
+    assert entry['sequences'] == [{'head': "plate.", 'tail': ".exr", 'pad': 4, 'ranges': [[1001, 1003], [1005, 1005]]}]
+    cached = daily.SequenceIndex(index_path).get_sequences(str(tmp_path / "shot"))
+    assert [item.path for item in cached[0]] == [item.path for item in sequences[0]]
+
+
+def test_index_merges_and_prunes(daily, tmp_path):
+    for name in ("a", "b", "c"):
+        make_directory(tmp_path / name, [1])
+    index_path = str(tmp_path / "index.json")
+    first = daily.SequenceIndex(index_path)
+    second = daily.SequenceIndex(index_path)
+    first.scan(str(tmp_path / "a"))
+    second.scan(str(tmp_path / "b"))
+    first.save()
+    second.save()
+    assert sorted(json.load(open(index_path))) == [str(tmp_path / "a"), str(tmp_path / "b")]
+
+    os.remove(str(tmp_path / "b" / "plate.0001.exr"))
+    os.rmdir(str(tmp_path / "b"))
+    third = daily.SequenceIndex(index_path, max_entries=1)
+    third.scan(str(tmp_path / "c"))
+    third.save()
+    assert sorted(json.load(open(index_path))) == [str(tmp_path / "c")]
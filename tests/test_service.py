@@ -0,0 +1,88 @@
+import json
+import os
+import threading
+import time
+
+import pytest
+
+
+class FakeDaily(object):
+    """
+    Stands in for GenerateDaily in the service: reports progress, then finishes with the given encoder status.
+    """
+    encoder_status = 0
+
+    def __init__(self, argv, cwd=None, progress_callback=None, service=False):
+        assert service
+        self.setup_success = True
+        progress_callback(24, 48)
+        progress_callback(48, 48)
+        target = type('Target', (object,), {})()
+        target.movie_fullpath = os.path.join(cwd, argv[0] + ".mov")
+        target.encoder_status = self.encoder_status
+        self.targets = [target]
+        self.chunk_status = []
+        if self.encoder_status:
+            self.failed_sequences = [argv[0]]
+            self.errors = ["ffmpeg exited with status {0}".format(self.encoder_status)]
+        else:
+            self.failed_sequences = []
+            self.errors = []
+
+
+class FailingDaily(FakeDaily):
+    encoder_status = 1
+
+
+@pytest.fixture
+def service(daily, tmp_path):
+    socket_path = str(tmp_path / "daily.sock")
+    service = daily.DailiesService(socket_path, jobs=2)
+    thread = threading.Thread(target=service.serve_forever)
+    thread.daemon = True
+    thread.start()
+    for attempt in range(100):
+        if os.path.exists(socket_path):
+            break
+        time.sleep(0.05)
+    yield service
+    daily.submit_request(socket_path, {'command': 'shutdown'}, quiet=True)
+    thread.join(5)
+    assert not thread.is_alive()
+    assert not os.path.exists(socket_path)
+
+
+def submit(daily, service, request, capsys):
+    capsys.readouterr()
+    code = daily.submit_request(service.socket_path, request)
+    return code, [json.loads(line) for line in capsys.readouterr().out.splitlines() if line.startswith("{")]
+
+
+def test_service_status(daily, service, capsys):
+    code, lines = submit(daily, service, {'command': 'status'}, capsys)
+    assert code == 0
+    assert lines == [{'status': 'ok', 'jobs': 2, 'running': 0, 'queued': 0}]
+
+
+def test_service_job(daily, service, capsys, monkeypatch, tmp_path):
+    monkeypatch.setattr(daily, 'GenerateDaily', FakeDaily)
+    code, lines = submit(daily, service, {'args': ["plates"], 'cwd': str(tmp_path)}, capsys)
+    assert code == 0
+    assert [line['status'] for line in lines] == ['queued', 'running', 'progress', 'progress', 'done']
+    assert lines[-1]['movies'] == [str(tmp_path / "plates.mov")]
+    assert lines[-1]['encoder_status'] == [0]
+
+
+def test_service_job_encoder_failed(daily, service, capsys, monkeypatch, tmp_path):
+    monkeypatch.setattr(daily, 'GenerateDaily', FailingDaily)
+    code, lines = submit(daily, service, {'args': ["plates"], 'cwd': str(tmp_path)}, capsys)
+    assert code == 1
+    assert lines[-1]['status'] == 'failed'
+    assert lines[-1]['encoder_status'] == [1]
+    assert "status 1" in lines[-1]['error']
+
+
+def test_service_invalid_request(daily, service, capsys):
+    code, lines = submit(daily, service, {'command': 'restart'}, capsys)
+    assert code == 1
+    assert lines[-1]['status'] == 'failed'
@@ -0,0 +1,75 @@
+import numpy as np
+import pytest
+
+from tc import Timecode
+
+FRAMERATES = ["23.98", "24", "25", "29.97", "30", "50", "59.94", "60", "ms"]
+
+
+def make_timecode(framerate, fractional=False):
+    timecode = Timecode(framerate, start_timecode="00:00:00:00")
+    timecode.set_fractional(fractional)
+    return timecode
+
+
+def frames_per_24_hours(timecode):
+    return int(round(float(timecode._framerate) * 60 * 60)) * 24
+
+
+def sample_frames(timecode, samples=2000, seed=0):
+    # The first frames, and random frames including negative frames and frames past 24 hours
+    day = frames_per_24_hours(timecode)
+    rng = np.random.RandomState(seed)
+    return np.concatenate([np.arange(-200, 20000), rng.randint(-4 * day, 4 * day, samples)])
+
+
+@pytest.mark.parametrize("fractional", [False, True])
+@pytest.mark.parametrize("framerate", FRAMERATES)
+def test_frames_to_tc_array_matches_scalar(framerate, fractional):
+    if fractional and framerate == "ms":
+        pytest.skip("ms timecodes have no fractional mode")
+    timecode = make_timecode(framerate, fractional)
+    frames = sample_frames(timecode)
+    hrs, mins, secs, frs = timecode.frames_to_tc_array(frames)
+    strings = timecode.tc_to_string_array(hrs, mins, secs, frs)
+    for i, frame in enumerate(frames):
+        expected = timecode.frames_to_tc(int(frame))
+        assert (hrs[i], mins[i], secs[i], frs[i]) == expected, frame
+        assert strings[i] == timecode.tc_to_string(*expected), frame
+
+
+@pytest.mark.parametrize("framerate", FRAMERATES)
+def test_tc_to_frames_array_round_trip(framerate):
+    timecode = make_timecode(framerate)
+    frames = sample_frames(timecode)
+    back = timecode.tc_to_frames_array(*timecode.frames_to_tc_array(frames))
+    # Timecode rolls over every 24 hours
+    assert not np.any((back - frames) % frames_per_24_hours(timecode))
+
+
+@pytest.mark.parametrize("framerate", ["29.97", "59.94"])
+def test_drop_frame(framerate):
+    timecode = make_timecode(framerate)
+    drop = 2 if framerate == "29.97" else 4
+    last = timecode._int_framerate - 1
+    # Frame numbers of the last frame of a minute, and of the frame after it
+    for minute, dropped in ((1, True), (2, True), (9, True), (10, False), (11, True)):
+        start = timecode.tc_to_frames_array(0, minute, 0, 0 if minute % 10 == 0 else drop)
+        strings = timecode.tc_to_string_array(*timecode.frames_to_tc_array([start - 1, start]))
+        assert strings[0] == "00:{0:02d}:59;{1:02d}".format(minute - 1, last)
+        assert strings[1] == "00:{0:02d}:00;{1:02d}".format(minute, drop if dropped else 0)
+
+
+def test_drop_frame_string_round_trip():
+    timecode = make_timecode("29.97")
+    for string in ("00:01:00;02", "00:10:00;00", "01:00:00;00", "23:59:59;29"):
+        frames = timecode.tc_to_frames(string)
+        hrs, mins, secs, frs = timecode.frames_to_tc_array([frames])
+        assert timecode.tc_to_string_array(hrs, mins, secs, frs)[0] == string
+        assert timecode.tc_to_frames_array(hrs, mins, secs, frs)[0] == frames
+
+
+def test_tc_range():
+    timecode = Timecode("24", start_timecode="01:00:00:22")
+    assert list(timecode.tc_range(4)) == ["01:00:00:22", "01:00:00:23", "01:00:01:00", "01:00:01:01"]
+    assert list(timecode.tc_range(3, step=24)) == ["01:00:00:22", "01:00:01:22", "01:00:02:22"]
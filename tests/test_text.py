@@ -0,0 +1,41 @@
+import collections
+import types
+
+
+class FakeImageBufAlgo(object):
+    """
+    Measures text as 10 pixels per character, so text layout runs without OpenImageIO.
+    """
+    calls = 0
+
+    @classmethod
+    def text_size(cls, text, fontsize=None, fontname=None):
+        cls.calls += 1
+        return types.SimpleNamespace(width=10 * len(text), height=12, xend=10 * len(text))
+
+
+def test_cache_evicts_least_recently_used(daily):
+    cache = collections.OrderedDict()
+    for key in "abc":
+        daily._cache_put(cache, key, key.upper(), 3)
+    assert daily._cache_get(cache, "a") == "A"
+    daily._cache_put(cache, "d", "D", 3)
+    assert list(cache) == ["c", "a", "d"]
+    assert daily._cache_get(cache, "b") is None
+
+
+def test_text_layouts_are_limited(daily, monkeypatch):
+    monkeypatch.setattr(daily, 'oiio', types.SimpleNamespace(ImageBufAlgo=FakeImageBufAlgo))
+    monkeypatch.setattr(daily, '_text_layouts', collections.OrderedDict())
+    monkeypatch.setattr(daily, '_text_advances', collections.OrderedDict())
+    monkeypatch.setattr(daily, 'TEXT_LAYOUTS_SIZE', 16)
+
+    assert daily.layout_text("a comment that wraps", "font.ttf", 20, 100) == (("a comment", "that wraps"), 12)
+    for index in range(100):
+        daily.layout_text("comment {0}".format(index), "font.ttf", 20, 1000)
+    assert len(daily._text_layouts) == 16
+
+    # Recent layouts are still cached
+    calls = FakeImageBufAlgo.calls
+    daily.layout_text("comment 99", "font.ttf", 20, 1000)
+    assert FakeImageBufAlgo.calls == calls